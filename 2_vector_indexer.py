@@ -13,7 +13,13 @@ import hashlib
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
-from tqdm import tqdm
+
+# Fast JSON parsing (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class N8nVectorIndexer:
     """Create and manage vector index for n8n documentation"""
@@ -97,22 +103,46 @@ class N8nVectorIndexer:
         if not chunks_file.exists():
             raise FileNotFoundError(f"Chunks file not found: {chunks_file}")
         
-        with open(chunks_file, 'r', encoding='utf-8') as f:
-            chunks = json.load(f)
+        if ORJSON_AVAILABLE:
+            chunks = orjson.loads(chunks_file.read_bytes())
+        else:
+            with open(chunks_file, 'r', encoding='utf-8') as f:
+                chunks = json.load(f)
         
         print(f"📄 Loaded {len(chunks)} chunks from {chunks_file}")
         return chunks
     
     def create_embeddings(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
         """Create embeddings for texts in batches"""
-        embeddings = []
-        
-        for i in tqdm(range(0, len(texts), batch_size), desc="Creating embeddings"):
-            batch = texts[i:i + batch_size]
-            batch_embeddings = self.embedding_model.encode(batch, show_progress_bar=False)
-            embeddings.extend(batch_embeddings)
-        
-        return np.array(embeddings)
+        # encode() length-sorts the texts into batches and returns them in the caller's order
+        return self.embedding_model.encode(texts, batch_size=batch_size, show_progress_bar=True)
+    
+    @staticmethod
+    def _content_hash(text: str, document: str, metadata: Dict[str, Any]) -> str:
+        """Stable digest of a chunk's embedding text, stored document and metadata"""
+        # indexed_at changes on every run and content_hash is this digest itself
+        stable_metadata = {
+            key: value for key, value in metadata.items()
+            if key not in ("indexed_at", "content_hash")
+        }
+        hash_obj = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+        hash_obj.update(b"\0")
+        hash_obj.update(document.encode("utf-8"))
+        hash_obj.update(b"\0")
+        hash_obj.update(json.dumps(stable_metadata, sort_keys=True).encode("utf-8"))
+        return hash_obj.hexdigest()
+    
+    def _unchanged_ids(self, collection, ids: List[str], content_hashes: List[str]) -> set:
+        """IDs already stored in the collection with the same content hash"""
+        existing = collection.get(ids=ids, include=["metadatas"])
+        stored_hashes = {
+            chunk_id: (metadata or {}).get("content_hash")
+            for chunk_id, metadata in zip(existing["ids"], existing["metadatas"])
+        }
+        return {
+            chunk_id for chunk_id, content_hash in zip(ids, content_hashes)
+            if stored_hashes.get(chunk_id) == content_hash
+        }
     
     def index_chunks(self, chunks: List[Dict[str, Any]]):
         """Index chunks into appropriate collections"""
@@ -165,6 +195,7 @@ class N8nVectorIndexer:
             texts = []
             metadatas = []
             documents = []
+            content_hashes = []
             
             for chunk in chunk_list:
                 chunk_id = chunk["chunk_id"]
@@ -191,43 +222,45 @@ class N8nVectorIndexer:
                 
                 # Store original content as document
                 documents.append(chunk.get("content", chunk["embedding_text"]))
+                
+                # Digest of the embedded text, stored document and metadata, checked on the next run
+                metadata["content_hash"] = self._content_hash(texts[-1], documents[-1], metadata)
+                content_hashes.append(metadata["content_hash"])
             
             if not ids:
                 print(f"  ⚠️ No unique chunks to index for {chunk_type}")
                 continue
+            
+            # Only re-index chunks whose text or metadata changed since they were last indexed
+            unchanged = self._unchanged_ids(collection, ids, content_hashes)
+            if unchanged:
+                keep = [i for i, chunk_id in enumerate(ids) if chunk_id not in unchanged]
+                ids = [ids[i] for i in keep]
+                texts = [texts[i] for i in keep]
+                metadatas = [metadatas[i] for i in keep]
+                documents = [documents[i] for i in keep]
+                print(f"  ⏭️ Skipping {len(unchanged)} unchanged {chunk_type} chunks")
+                if not ids:
+                    continue
                 
             print(f"  📊 Processing {len(ids)} unique chunks for {chunk_type}")
             
             # Create embeddings
             embeddings = self.create_embeddings(texts)
             
-            # Add to collection with duplicate handling
+            # Upsert so changed chunks, which keep their node-derived IDs, replace the stored record
             try:
-                collection.add(
+                collection.upsert(
                     ids=ids,
                     embeddings=embeddings.tolist(),
                     metadatas=metadatas,
                     documents=documents
                 )
-            except Exception as e:
-                if "duplicate" in str(e).lower():
-                    print(f"  ⚠️ Handling duplicate IDs in {chunk_type} chunks...")
-                    # Try to upsert instead
-                    try:
-                        collection.upsert(
-                            ids=ids,
-                            embeddings=embeddings.tolist(),
-                            metadatas=metadatas,
-                            documents=documents
-                        )
-                        print(f"  ✅ Successfully upserted {len(chunk_list)} {chunk_type} chunks")
-                    except Exception as upsert_error:
-                        print(f"  ❌ Failed to upsert {chunk_type}: {upsert_error}")
-                        raise
-                else:
-                    raise
+            except Exception as upsert_error:
+                print(f"  ❌ Failed to upsert {chunk_type}: {upsert_error}")
+                raise
             
-            print(f"  ✅ Indexed {len(chunk_list)} {chunk_type} chunks")
+            print(f"  ✅ Indexed {len(ids)} {chunk_type} chunks")
     
     def create_index_statistics(self) -> Dict[str, Any]:
         """Generate statistics about the vector index"""
@@ -15,6 +15,14 @@ from datetime import datetime
 import chromadb
 from sentence_transformers import SentenceTransformer
 
+# Fast JSON parsing (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
 class WorkflowIntent(Enum):
     """Types of workflow intents"""
     WEBHOOK_TRIGGER = "webhook_trigger"
@@ -288,8 +296,11 @@ class N8nContextAssembler:
         """Load metadata index"""
         metadata_file = self.metadata_dir / "index.json"
         if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                self.metadata = json.load(f)
+            if ORJSON_AVAILABLE:
+                self.metadata = orjson.loads(metadata_file.read_bytes())
+            else:
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    self.metadata = json.load(f)
         else:
             self.metadata = {}
     
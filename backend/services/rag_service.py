@@ -1491,7 +1491,7 @@ class RAGService:
         return {
             "data_directory": data_dir.exists(),
             "vector_directory": vector_dir.exists(),
-            "node_files": len(list((data_dir / "nodes").glob("*.json"))) if data_dir.exists() else 0,
+            "node_files": sum(1 for f in (data_dir / "nodes").glob("*") if f.name.endswith((".json", ".msgpack.zst"))) if data_dir.exists() else 0,
             "template_files": len(list((data_dir / "templates").glob("*.json"))) if data_dir.exists() else 0
         }
     
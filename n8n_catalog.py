@@ -0,0 +1,569 @@
+"""
+n8n Node Catalog
+Static catalog of n8n node definitions shared by the RAG pipeline
+"""
+
+import hashlib
+import json
+import sqlite3
+import sys
+from bisect import bisect_left
+from collections.abc import Mapping as MappingABC, Sequence
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+# Fast JSON parsing (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Longer strings (descriptions, documentation) are effectively unique; interning
+# them would only grow the interpreter's intern table
+_INTERN_MAX_LEN = 32
+
+
+def _intern(obj: Any) -> Any:
+    """Recursively intern every key and every short string value in a catalog structure"""
+    if isinstance(obj, str):
+        return sys.intern(obj) if len(obj) < _INTERN_MAX_LEN else obj
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern(item) for item in obj]
+    if isinstance(obj, tuple):
+        return tuple(_intern(item) for item in obj)
+    return obj
+
+
+def deep_freeze(obj: Any) -> Any:
+    """Recursively wrap dicts in read-only MappingProxyType views and lists in tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: deep_freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(deep_freeze(item) for item in obj)
+    # Tuples are already frozen (e.g. pooled option lists) and are kept as-is
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Recursively copy a frozen catalog structure back into plain dicts and lists"""
+    if isinstance(obj, MappingABC):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [thaw(item) for item in obj]
+    return obj
+
+
+@dataclass(frozen=True, eq=False)
+class NodeDef(MappingABC):
+    """One catalog entry; readable by attribute or, like the raw JSON dict, by key"""
+    # Entries hash by nodeType but cannot be pickled or deep-copied; thaw() is
+    # the supported way to get a plain, mutable copy
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "nodeType", "displayName", "description", "category", "package",
+        "isTrigger", "isAITool", "properties", "documentation", "examples"
+    )
+    
+    nodeType: str
+    displayName: str
+    description: str
+    category: str
+    package: str
+    isTrigger: bool
+    isAITool: bool
+    properties: Mapping[str, Any]
+    documentation: str
+    examples: Tuple[Mapping[str, Any], ...]
+    
+    # Mapping protocol: optional fields that are None are treated as absent keys
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in self.__slots__ if getattr(self, name) is not None)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    # Equal entries share a nodeType, so this agrees with Mapping.__eq__;
+    # hashing the fields would fail on the frozen properties mapping
+    def __hash__(self) -> int:
+        return hash(self.nodeType)
+
+
+_NODE_DEF_FIELDS = tuple(f.name for f in fields(NodeDef))
+
+# Values shared by most entries; the catalog file only spells out fields that differ
+_NODE_DEFAULTS = {
+    "package": "n8n-nodes-base",
+    "isTrigger": False,
+    "isAITool": True
+}
+
+
+def _make_node_def(raw_node: Dict[str, Any]) -> NodeDef:
+    """Freeze one raw catalog dict into a NodeDef, filling defaults and leaving other absent fields as None"""
+    return NodeDef(*(
+        deep_freeze(raw_node.get(name, _NODE_DEFAULTS.get(name))) for name in _NODE_DEF_FIELDS
+    ))
+
+
+# Comprehensive catalog of n8n nodes, stored as JSON next to this module
+_CATALOG_FILE = Path(__file__).with_name("n8n_nodes.json")
+
+# Canonical frozen property schemas and examples, keyed by their JSON text
+_SCHEMA_POOL: Dict[str, Mapping[str, Any]] = {}
+
+# Canonical option tuples shared by identical enums, keyed by their JSON text
+_OPTIONS_POOL: Dict[str, Tuple[Any, ...]] = {}
+
+
+def _share_schemas(nodes: List[Dict[str, Any]]) -> None:
+    """Replace identical property schemas, option lists and examples with one shared frozen object"""
+    for node in nodes:
+        properties = node.get("properties", {})
+        for name, schema in properties.items():
+            key = json.dumps(schema)
+            if isinstance(schema.get("options"), list):
+                options = schema["options"]
+                schema["options"] = _OPTIONS_POOL.setdefault(json.dumps(options), deep_freeze(options))
+            properties[name] = _SCHEMA_POOL.setdefault(key, deep_freeze(schema))
+        examples = node.get("examples", [])
+        for i, example in enumerate(examples):
+            key = json.dumps(example)
+            examples[i] = _SCHEMA_POOL.setdefault(key, deep_freeze(example))
+
+
+def _read_raw_nodes() -> List[Dict[str, Any]]:
+    """Parse the catalog file into plain dicts"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(_CATALOG_FILE.read_bytes())
+    with open(_CATALOG_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def catalog_digest() -> str:
+    """Content hash of the catalog file, for keying artifacts derived from it"""
+    return hashlib.blake2b(_CATALOG_FILE.read_bytes(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _load_nodes() -> Tuple[NodeDef, ...]:
+    """Parse the catalog file once per process, then intern and freeze it"""
+    # Entries are trusted here; run `python n8n_catalog.py` to validate after editing the file
+    raw_nodes = _intern(_read_raw_nodes())
+    _share_schemas(raw_nodes)
+    return tuple(_make_node_def(raw_node) for raw_node in raw_nodes)
+
+
+class _LazyNodes(Sequence):
+    """Read-only sequence view that loads the catalog on first access"""
+    
+    def __getitem__(self, index):
+        return _load_nodes()[index]
+    
+    def __len__(self) -> int:
+        return len(_load_nodes())
+    
+    def __iter__(self) -> Iterator[NodeDef]:
+        return iter(_load_nodes())
+    
+    def __repr__(self) -> str:
+        return f"<n8n node catalog: {_CATALOG_FILE.name}>"
+
+
+# Entries are frozen so every caller can share them; use thaw() for a mutable copy
+NODES = _LazyNodes()
+
+
+def unique_nodes() -> List[NodeDef]:
+    """Catalog entries with duplicate node types removed (first definition wins)"""
+    seen_types = set()
+    nodes = []
+    for node in NODES:
+        if node["nodeType"] not in seen_types:
+            seen_types.add(node["nodeType"])
+            nodes.append(node)
+    return nodes
+
+
+class _CatalogIndex(NamedTuple):
+    """Lookup tables over the unique catalog nodes"""
+    by_type: Dict[str, Mapping[str, Any]]
+    by_bare_name: Dict[str, Tuple[Mapping[str, Any], ...]]
+    by_short_name: Dict[str, Tuple[Mapping[str, Any], ...]]
+    sorted_types: Tuple[str, ...]
+    by_category: Dict[str, Tuple[Mapping[str, Any], ...]]
+    ai_tools: Tuple[Mapping[str, Any], ...]
+    ai_tool_types: FrozenSet[str]
+    trigger_types: FrozenSet[str]
+    types_by_category: Mapping[str, Tuple[str, ...]]
+    types_by_package: Mapping[str, FrozenSet[str]]
+
+
+def _bare_name(node_type: str) -> str:
+    """Name without the package prefix ('n8n-nodes-base.googleSheets' -> 'googleSheets')"""
+    return node_type.rsplit(".", 1)[-1]
+
+
+def _short_name(node_type: str) -> str:
+    """Case-insensitive bare name ('n8n-nodes-base.googleSheets' -> 'googlesheets')"""
+    return _bare_name(node_type).lower()
+
+
+@lru_cache(maxsize=1)
+def _index() -> _CatalogIndex:
+    """Build the node-type, category, package, trigger and AI-tool lookups in one pass"""
+    by_type = {}
+    by_bare_name = {}
+    by_short_name = {}
+    by_category = {}
+    by_package = {}
+    ai_tools = []
+    triggers = []
+    for node in unique_nodes():
+        by_type[node["nodeType"]] = node
+        by_bare_name.setdefault(_bare_name(node["nodeType"]), []).append(node)
+        by_short_name.setdefault(_short_name(node["nodeType"]), []).append(node)
+        by_category.setdefault(node["category"], []).append(node)
+        by_package.setdefault(node["package"], []).append(node["nodeType"])
+        if node["isAITool"]:
+            ai_tools.append(node)
+        if node["isTrigger"]:
+            triggers.append(node["nodeType"])
+    return _CatalogIndex(
+        by_type=by_type,
+        by_bare_name={name: tuple(nodes) for name, nodes in by_bare_name.items()},
+        by_short_name={name: tuple(nodes) for name, nodes in by_short_name.items()},
+        sorted_types=tuple(sorted(by_type)),
+        by_category={category: tuple(nodes) for category, nodes in by_category.items()},
+        ai_tools=tuple(ai_tools),
+        ai_tool_types=frozenset(node["nodeType"] for node in ai_tools),
+        trigger_types=frozenset(triggers),
+        types_by_category=MappingProxyType({
+            category: tuple(node["nodeType"] for node in nodes)
+            for category, nodes in by_category.items()
+        }),
+        types_by_package=MappingProxyType({
+            package: frozenset(node_types) for package, node_types in by_package.items()
+        })
+    )
+
+
+def get_node(node_type: str) -> Mapping[str, Any]:
+    """Catalog entry for a node type; raises KeyError if it is unknown"""
+    return _index().by_type[node_type]
+
+
+def resolve_node(name: str) -> Mapping[str, Any]:
+    """Catalog entry for a full node type or a bare name like 'googleSheets'; raises KeyError if unknown"""
+    index = _index()
+    node = index.by_type.get(name)
+    if node is not None:
+        return node
+    
+    # Fall back to a case-insensitive match only when no bare name matches exactly;
+    # neither lookup picks between packages sharing a name or names differing in case
+    matches = index.by_bare_name.get(_bare_name(name)) or index.by_short_name.get(_short_name(name), ())
+    if len(matches) > 1:
+        raise KeyError(f"{name!r} is ambiguous: {', '.join(n['nodeType'] for n in matches)}")
+    if not matches:
+        raise KeyError(name)
+    return matches[0]
+
+
+def node_types_with_prefix(prefix: str) -> Tuple[str, ...]:
+    """Node types starting with prefix (e.g. '@n8n/n8n-nodes-langchain.'), in sorted order"""
+    sorted_types = _index().sorted_types
+    start = bisect_left(sorted_types, prefix)
+    end = start
+    while end < len(sorted_types) and sorted_types[end].startswith(prefix):
+        end += 1
+    return sorted_types[start:end]
+
+
+def get_nodes_by_category(category: str) -> Tuple[Mapping[str, Any], ...]:
+    """All catalog entries in a category (empty for unknown categories)"""
+    return _index().by_category.get(category, ())
+
+
+def get_ai_tool_nodes() -> Tuple[Mapping[str, Any], ...]:
+    """All catalog entries usable as AI tools"""
+    return _index().ai_tools
+
+
+# Index-backed module attributes, resolved on access so importing stays lazy
+_LAZY_ATTRIBUTES = {
+    "AI_TOOL_TYPES": "ai_tool_types",
+    "TRIGGER_TYPES": "trigger_types",
+    "NODES_BY_CATEGORY": "types_by_category",
+    "NODES_BY_PACKAGE": "types_by_package"
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Frozensets AI_TOOL_TYPES/TRIGGER_TYPES and NODES_BY_CATEGORY/NODES_BY_PACKAGE (-> node types)"""
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(_index(), _LAZY_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Python types accepted for each n8n property type; other types are not type-checked
+_PROPERTY_TYPES = {
+    "string": (str,),
+    "dateTime": (str,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "json": (str, dict, list),
+    "object": (str, dict),
+    "collection": (dict, list),
+    "fixedCollection": (dict, list),
+    "multiOptions": (list, tuple)
+}
+
+
+class _PropertyRule(NamedTuple):
+    """Precompiled validation rule for one property schema"""
+    required: bool
+    types: Optional[Tuple[type, ...]]
+    options: Optional[Tuple[Any, ...]]
+    multi: bool
+
+
+class _PropertyCheck(NamedTuple):
+    """A compiled rule bound to the parameter name it checks"""
+    name: str
+    rule: _PropertyRule
+
+
+# Compiled rules keyed by schema identity; pooled schemas are shared across nodes and
+# kept alive by _SCHEMA_POOL, so each distinct schema is compiled once
+_RULES_BY_SCHEMA: Dict[int, _PropertyRule] = {}
+
+
+def _compile_rule(spec: Mapping[str, Any]) -> _PropertyRule:
+    """Compile (or reuse) the validation rule for one property schema"""
+    rule = _RULES_BY_SCHEMA.get(id(spec))
+    if rule is None:
+        prop_type = spec.get("type")
+        enum_like = prop_type in ("options", "multiOptions") and "options" in spec
+        rule = _RULES_BY_SCHEMA[id(spec)] = _PropertyRule(
+            required=bool(spec.get("required")),
+            types=_PROPERTY_TYPES.get(prop_type),
+            options=tuple(spec["options"]) if enum_like else None,
+            multi=prop_type == "multiOptions"
+        )
+    return rule
+
+
+@lru_cache(maxsize=None)
+def _property_checks(node_type: str) -> Tuple[_PropertyCheck, ...]:
+    """Compile a node type's property definitions once; the catalog never changes at runtime"""
+    return tuple(
+        _PropertyCheck(name, _compile_rule(spec))
+        for name, spec in get_node(node_type)["properties"].items()
+    )
+
+
+def validate_config(node_type: str, parameters: Mapping[str, Any]) -> None:
+    """Check node parameters against the catalog; raises ValueError listing every problem"""
+    errors = []
+    for name, rule in _property_checks(node_type):
+        if name not in parameters:
+            if rule.required:
+                errors.append(f"missing required parameter '{name}'")
+            continue
+        
+        value = parameters[name]
+        # n8n expressions are only resolved at execution time
+        if isinstance(value, str) and value.startswith("="):
+            continue
+        # bool is an int subclass, so only accept it where booleans are expected
+        if rule.types and (
+            not isinstance(value, rule.types)
+            or (isinstance(value, bool) and bool not in rule.types)
+        ):
+            errors.append(f"'{name}' should be {rule.types[0].__name__}, got {type(value).__name__}")
+            continue
+        if rule.options is not None:
+            values = value if rule.multi else (value,)
+            invalid = [v for v in values if v not in rule.options]
+            if invalid:
+                errors.append(f"'{name}' has invalid value(s) {invalid}; expected one of {list(rule.options)}")
+    
+    if errors:
+        raise ValueError(f"Invalid parameters for {node_type}: " + "; ".join(errors))
+
+
+class NodeColumns:
+    """Column-oriented view of the catalog: one array per field, one row per node"""
+    
+    def __init__(self, nodes: List[Mapping[str, Any]]):
+        # numpy is imported on first use so plain catalog lookups stay cheap to import
+        import numpy as np
+        
+        self._nodes = tuple(nodes)
+        count = len(self._nodes)
+        self.node_types: Tuple[str, ...] = tuple(n["nodeType"] for n in self._nodes)
+        self.categories: Tuple[str, ...] = tuple(n["category"] for n in self._nodes)
+        self.packages: Tuple[str, ...] = tuple(n["package"] for n in self._nodes)
+        self.is_trigger = np.fromiter((n["isTrigger"] for n in self._nodes), dtype=bool, count=count)
+        self.is_ai_tool = np.fromiter((n["isAITool"] for n in self._nodes), dtype=bool, count=count)
+        
+        # Packed bitmaps (one bit per node) so filters AND together without branching
+        categories = np.array(self.categories, dtype=object)
+        self.category_bitmaps: Dict[str, "np.ndarray"] = {
+            category: np.packbits(categories == category)
+            for category in dict.fromkeys(self.categories)
+        }
+        self.is_trigger_mask = np.packbits(self.is_trigger)
+        self.is_ai_tool_mask = np.packbits(self.is_ai_tool)
+    
+    def __len__(self) -> int:
+        return len(self._nodes)
+    
+    def select(
+        self,
+        category: Optional[str] = None,
+        is_trigger: Optional[bool] = None,
+        is_ai_tool: Optional[bool] = None
+    ) -> "np.ndarray":
+        """Row indices of nodes matching every given filter"""
+        import numpy as np
+        
+        mask = np.packbits(np.ones(len(self), dtype=bool))
+        if category is not None:
+            empty = np.zeros_like(mask)
+            mask &= self.category_bitmaps.get(category, empty)
+        if is_trigger is not None:
+            mask &= self.is_trigger_mask if is_trigger else ~self.is_trigger_mask
+        if is_ai_tool is not None:
+            mask &= self.is_ai_tool_mask if is_ai_tool else ~self.is_ai_tool_mask
+        return np.flatnonzero(np.unpackbits(mask, count=len(self)))
+    
+    def to_dict(self, i: int) -> Mapping[str, Any]:
+        """Full catalog entry for row i"""
+        return self._nodes[i]
+
+
+@lru_cache(maxsize=1)
+def node_columns() -> NodeColumns:
+    """Columnar view of the unique catalog nodes, built on first use"""
+    return NodeColumns(unique_nodes())
+
+
+def open_catalog_table(path: Path) -> "pa.Table":
+    """Memory-map the Arrow IPC catalog table (metadata/nodes.arrow) written by the extractor"""
+    # Buffers stay in the page cache, so all worker processes share one physical copy;
+    # the properties/examples columns are JSON strings to decode per row on demand
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+    except ImportError as e:
+        raise ImportError("pyarrow is required to open the catalog table") from e
+    source = pa.memory_map(str(path), "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def _fts_query(text: str) -> str:
+    """FTS5 query matching every word of plain text; quoting keeps '-', ':' or quotes from parsing as syntax"""
+    return " ".join('"' + token.replace('"', '""') + '"' for token in text.split())
+
+
+def search_catalog_db(path: Path, query: str, limit: int = 10) -> List[str]:
+    """Node types whose name, description or documentation contain every word of query, best first"""
+    fts_query = _fts_query(query)
+    if not fts_query:
+        return []
+    
+    # The database (metadata/nodes.db) is written by the extractor
+    conn = sqlite3.connect(Path(path).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT nodes.node_type FROM nodes_fts JOIN nodes ON nodes.rowid = nodes_fts.rowid "
+            "WHERE nodes_fts MATCH ? ORDER BY bm25(nodes_fts) LIMIT ?",
+            (fts_query, limit)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [row[0] for row in rows]
+
+
+def load_node_from_db(path: Path, node_type: str) -> Dict[str, Any]:
+    """Read a single catalog entry from metadata/nodes.db without loading the full catalog"""
+    conn = sqlite3.connect(Path(path).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        row = conn.execute("SELECT json FROM nodes WHERE node_type = ?", (node_type,)).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        raise KeyError(node_type)
+    return orjson.loads(row[0]) if ORJSON_AVAILABLE else json.loads(row[0])
+
+
+# Expected JSON type of every catalog field
+_FIELD_TYPES = {
+    "nodeType": str,
+    "displayName": str,
+    "description": str,
+    "category": str,
+    "package": str,
+    "isTrigger": bool,
+    "isAITool": bool,
+    "properties": dict,
+    "documentation": str,
+    "examples": list
+}
+
+
+def validate_catalog() -> List[str]:
+    """Check the raw catalog file for missing fields, wrong types and bad option defaults"""
+    errors = []
+    for i, node in enumerate(_read_raw_nodes()):
+        node = {**_NODE_DEFAULTS, **node}
+        label = f"#{i} {node.get('nodeType', '?')}"
+        for field, expected in _FIELD_TYPES.items():
+            if not isinstance(node.get(field), expected):
+                errors.append(f"{label}: '{field}' should be {expected.__name__}")
+        if not str(node.get("nodeType", "")).startswith(("n8n-nodes-", "@n8n/")):
+            errors.append(f"{label}: nodeType has no n8n package prefix")
+        
+        # A non-dict properties value was reported above
+        properties = node.get("properties")
+        for name, spec in (properties.items() if isinstance(properties, dict) else ()):
+            if not isinstance(spec, dict):
+                errors.append(f"{label}: '{name}' schema should be an object")
+                continue
+            if "options" not in spec or "default" not in spec:
+                continue
+            if spec.get("type") == "options":
+                defaults = [spec["default"]]
+            elif spec.get("type") == "multiOptions":
+                defaults = spec["default"]
+            else:
+                continue
+            if any(default not in spec["options"] for default in defaults):
+                errors.append(f"{label}: default of '{name}' is not one of its options")
+    return errors
+
+
+if __name__ == "__main__":
+    problems = validate_catalog()
+    for problem in problems:
+        print(f"  ❌ {problem}")
+    if problems:
+        print(f"❌ {len(problems)} problem(s) in {_CATALOG_FILE.name}")
+        sys.exit(1)
+    print(f"✅ {_CATALOG_FILE.name} is valid ({len(NODES)} nodes)")
@@ -0,0 +1,79 @@
+"""Tests for the n8n_catalog access layer"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import n8n_catalog
+from n8n_catalog import load_node_from_db, resolve_node, search_catalog_db, validate_catalog
+
+
+@pytest.fixture(scope="module")
+def catalog_db(tmp_path_factory):
+    """metadata/nodes.db as written by the extractor"""
+    # The extractor module name starts with a digit, so load it by path
+    spec = importlib.util.spec_from_file_location(
+        "n8n_data_extractor", REPO_ROOT / "1_1_n8n_data_extractor.py"
+    )
+    extractor_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(extractor_module)
+    
+    output_dir = tmp_path_factory.mktemp("n8n_rag_data")
+    return extractor_module.N8nDataExtractor(output_dir=str(output_dir)).export_catalog_db()
+
+
+def test_search_catalog_db_hyphenated_query(catalog_db):
+    assert "n8n-nodes-base.googleSheets" in search_catalog_db(catalog_db, "google-sheets")
+
+
+def test_search_catalog_db_plain_text_with_quotes(catalog_db):
+    assert search_catalog_db(catalog_db, "O'Reilly \"quoted\" AND: NOT") == []
+    assert search_catalog_db(catalog_db, "   ") == []
+
+
+def test_load_node_from_db(catalog_db):
+    assert load_node_from_db(catalog_db, "n8n-nodes-base.slack")["nodeType"] == "n8n-nodes-base.slack"
+    with pytest.raises(KeyError):
+        load_node_from_db(catalog_db, "n8n-nodes-base.missing")
+
+
+def test_validate_catalog_reports_malformed_properties(monkeypatch):
+    node = {"nodeType": "n8n-nodes-base.bad", "displayName": "Bad", "description": "", "category": "action",
+            "documentation": "", "examples": []}
+    monkeypatch.setattr(n8n_catalog, "_read_raw_nodes", lambda: [
+        dict(node, properties=["a"]),
+        dict(node, properties={"a": 5})
+    ])
+    assert validate_catalog() == [
+        "#0 n8n-nodes-base.bad: 'properties' should be dict",
+        "#1 n8n-nodes-base.bad: 'a' schema should be an object"
+    ]
+
+
+def test_resolve_node_prefers_exact_bare_name():
+    assert resolve_node("woocommerce")["nodeType"] == "n8n-nodes-base.woocommerce"
+    assert resolve_node("wooCommerce")["nodeType"] == "n8n-nodes-base.wooCommerce"
+    assert resolve_node("googlesheets")["nodeType"] == "n8n-nodes-base.googleSheets"
+    with pytest.raises(KeyError, match="ambiguous"):
+        resolve_node("WooCommerce")
+
+
+def test_resolve_node_bare_name_shared_by_packages(monkeypatch):
+    webhook = n8n_catalog.get_node("n8n-nodes-base.webhook")
+    twin = n8n_catalog._make_node_def(
+        dict(n8n_catalog.thaw(webhook), nodeType="@n8n/n8n-nodes-langchain.webhook")
+    )
+    monkeypatch.setattr(n8n_catalog, "unique_nodes", lambda: (webhook, twin))
+    n8n_catalog._index.cache_clear()
+    try:
+        with pytest.raises(KeyError, match="ambiguous"):
+            resolve_node("webhook")
+        assert resolve_node("@n8n/n8n-nodes-langchain.webhook") is twin
+    finally:
+        monkeypatch.undo()
+        n8n_catalog._index.cache_clear()